@@ -1,6 +1,17 @@
 import re
 from typing import Type, Tuple as Tuple_, Union as Union_, Hashable, Callable as Callable_
-from typed.mods.helper.helper import _flat, _is_null_of_type, _get_null_object, _get_type_display_name
+from typed.mods.helper.helper import (
+    _flat,
+    _is_null_of_type,
+    _get_null_object,
+    _get_type_display_name,
+    _typed_any,
+    _list_null,
+    _tuple_null,
+    _prod_null,
+    _set_null,
+    _dict_null
+)
 from typed.mods.types.func import TypedFuncType
 
 def Union(*args: Union_[Tuple_[Type], Tuple_[TypedFuncType]]) -> Union_[Type, TypedFuncType]:
@@ -73,7 +84,7 @@ def Union(*args: Union_[Tuple_[Type], Tuple_[TypedFuncType]]) -> Union_[Type, Ty
             def __instancecheck__(cls, instance):
                 return False
             def __subclasscheck__(cls, subclass):
-                from typed.mods.types.base import Any
+                Any = _typed_any()
                 if subclass is cls or subclass is Any:
                     return True
                 return False
@@ -81,20 +92,10 @@ def Union(*args: Union_[Tuple_[Type], Tuple_[TypedFuncType]]) -> Union_[Type, Ty
 
     class _Union(type):
         def __instancecheck__(cls, instance):
-            for t in cls.__types__:
-                if isinstance(t, type):
-                    if hasattr(t, '__instancecheck__'):
-                        result = t.__instancecheck__(instance)
-                        if result:
-                            return True
-                    else:
-                        result = isinstance(instance, t)
-                        if result:
-                            return True
-            return False
+            return type(instance) in cls.__exact_types__ or isinstance(instance, cls.__types_tuple__)
 
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if hasattr(subclass, '__types__') and getattr(cls, '__types__', None) == getattr(subclass, '__types__', None):
                 return True
 
@@ -115,8 +116,15 @@ def Union(*args: Union_[Tuple_[Type], Tuple_[TypedFuncType]]) -> Union_[Type, Ty
                             return True
             return False
 
+    exact_types = frozenset(t for t in _flattypes if type(t) is type and not hasattr(t, 'check'))
+    checked_types = tuple(t for t in _flattypes if hasattr(t, 'check'))
     class_name = f"Union({', '.join(t.__name__ for t in _flattypes)})"
-    return _Union(class_name, (), {'__types__': _flattypes})
+    return _Union(class_name, (), {
+        '__types__': _flattypes,
+        '__types_tuple__': tuple(_flattypes),
+        '__exact_types__': exact_types,
+        '__checked_types__': checked_types
+    })
 
 def Prod(*args: Union_[Tuple_[Type, int], Tuple_[TypedFuncType]]) -> Union_[Type, TypedFuncType]:
     """
@@ -174,7 +182,7 @@ def Prod(*args: Union_[Tuple_[Type, int], Tuple_[TypedFuncType]]) -> Union_[Type
             return all(isinstance(x, t) for x, t in zip(instance, self.__types__))
 
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if subclass is cls or subclass is Any or issubclass(subclass, tuple):
                 return True
             if hasattr(subclass, '__bases__') and tuple in subclass.__bases__ and hasattr(subclass, '__types__') and len(subclass.__types__) == len(cls.__types__):
@@ -188,7 +196,7 @@ def Prod(*args: Union_[Tuple_[Type, int], Tuple_[TypedFuncType]]) -> Union_[Type
             return tuple.__new__(cls, args)
 
     class_name = f"Prod({', '.join(t.__name__ for t in _flattypes)})"
-    return _Prod(class_name, (tuple,), {'__types__': _flattypes, '__new__': prod_new})
+    return _Prod(class_name, (tuple,), {'__types__': _flattypes, '__new__': prod_new, '_null_factory': _prod_null})
 
 def UProd(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncType]:
     """
@@ -232,7 +240,9 @@ def UProd(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncT
             if len(instance) != len(cls.__types__):
                 return False
 
-            type_counts = {typ: cls.__types__.count(typ) for typ in cls.__types__}
+            type_counts = {}
+            for typ in cls.__types__:
+                type_counts[typ] = type_counts.get(typ, 0) + 1
             for elem in instance:
                 for typ in type_counts:
                     if isinstance(elem, typ) and type_counts[typ] > 0:
@@ -248,14 +258,14 @@ def UProd(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncT
             return all(any(isinstance(elem, typ) for typ in self.__types__) for elem in instance)
 
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if subclass is cls or subclass is Any or issubclass(subclass, tuple):
                 return True
             if hasattr(subclass, '__bases__') and tuple in subclass.__bases__ and hasattr(subclass, '__types__') and len(subclass.__types__) == len(cls.__types__):
                 return all(any(issubclass(st, ct) for ct in cls.__types__) for st in subclass.__types__)
             return False
     class_name = f"UProd({', '.join(t.__name__ for t in _flattypes)})"
-    return _Uprod(class_name, (tuple,), {'__types__': _flattypes})
+    return _Uprod(class_name, (tuple,), {'__types__': _flattypes, '_null_factory': _tuple_null})
 
 def Tuple(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncType]:
     """
@@ -293,7 +303,7 @@ def Tuple(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncT
             def __instancecheck__(cls, instance):
                 return isinstance(instance, tuple)
             def __subclasscheck__(cls, subclass):
-                from typed.mods.types.base import Any
+                Any = _typed_any()
                 if subclass is cls or subclass is Any or issubclass(subclass, tuple):
                     return True
                 return False
@@ -312,7 +322,7 @@ def Tuple(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncT
             return all(isinstance(x, ElementUnion) for x in instance)
 
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if subclass is cls or subclass is Any or issubclass(subclass, tuple):
                 return True
             if hasattr(subclass, '__bases__') and tuple in subclass.__bases__ and hasattr(subclass, '__types__'):
@@ -325,7 +335,7 @@ def Tuple(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncT
         class_name = f"Tuple({', '.join(t.__name__ for t in _flattypes)}, ...)"
     else:
         class_name = "Tuple()"
-    return _Tuple(class_name, (tuple,), {'__types__': _flattypes})
+    return _Tuple(class_name, (tuple,), {'__types__': _flattypes, '_null_factory': _tuple_null})
 
 def List(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncType]:
     """
@@ -368,7 +378,7 @@ def List(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncTy
                 return False
             return all(isinstance(x, ElementUnion) for x in instance)
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if subclass is cls or subclass is Any or issubclass(subclass, list):
                 return True
             if hasattr(subclass, '__bases__') and list in subclass.__bases__ and hasattr(subclass, '__types__'):
@@ -381,7 +391,7 @@ def List(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncTy
         class_name = f"List({', '.join(t.__name__ for t in _flattypes)}, ...)"
     else:
         class_name = "List()"
-    return _List(class_name, (list,), {'__types__': _flattypes})
+    return _List(class_name, (list,), {'__types__': _flattypes, '_null_factory': _list_null})
 
 def Set(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncType]:
     """
@@ -423,13 +433,13 @@ def Set(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncTyp
         def __instancecheck__(cls, instance):
             if not isinstance(instance, set):
                 return False
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if Any is args:
                 return True
             return all(isinstance(x, ElementUnion) for x in instance)
 
         def __subclasscheck__(cls, subclass: Type) -> bool:
-            from typed.mods.types.base import Any
+            Any = _typed_any()
 
             if subclass is cls or subclass is Any or issubclass(subclass, set):
                 return True
@@ -446,7 +456,7 @@ def Set(*args: Union_[Tuple_[Type], TypedFuncType]) -> Union_[Type, TypedFuncTyp
     else:
         class_name = "Set()"
 
-    return _Set(class_name, (set,), {'__types__': _flattypes})
+    return _Set(class_name, (set,), {'__types__': _flattypes, '_null_factory': _set_null})
 
 def Dict(*args: Union_[Tuple_[Type], TypedFuncType], keys=None) -> Union_[Type, TypedFuncType]:
     """
@@ -471,7 +481,7 @@ def Dict(*args: Union_[Tuple_[Type], TypedFuncType], keys=None) -> Union_[Type,
             def __instancecheck__(cls, instance):
                 return isinstance(instance, dict)
             def __subclasscheck__(cls, subclass):
-                from typed.mods.types.base import Any
+                Any = _typed_any()
                 if subclass is cls or subclass is Any or issubclass(subclass, dict):
                     return True
                 return False
@@ -532,7 +542,7 @@ def Dict(*args: Union_[Tuple_[Type], TypedFuncType], keys=None) -> Union_[Type,
             return True
 
         def __subclasscheck__(cls, subclass):
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if subclass is cls or subclass is Any or issubclass(subclass, dict):
                 return True
             if hasattr(subclass, '__bases__') and dict in subclass.__bases__ and hasattr(subclass, '__types__'):
@@ -549,7 +559,11 @@ def Dict(*args: Union_[Tuple_[Type], TypedFuncType], keys=None) -> Union_[Type,
     typename = f"Dict({', '.join(t.__name__ for t in _flattypes)})"
     if key_type is not None:
         typename = f"Dict({', '.join(t.__name__ for t in _flattypes)}, keys={key_type.__name__})"
-    return _Dict(typename, (dict,), {'__types__': _flattypes, '__key_type__': key_type})
+    return _Dict(typename, (dict,), {
+        '__types__': _flattypes,
+        '__key_type__': key_type,
+        '_null_factory': _dict_null
+    })
 
 def Null(typ: Union_[Type, Callable_]) -> Type:
     """
@@ -6,7 +6,8 @@ from typed.mods.helper.helper import (
     _hinted_codomain,
     _get_num_args,
     _get_num_pos_args,
-    _get_num_kwargs
+    _get_num_kwargs,
+    _typed_any
 )
 from typed.mods.types.func import (
     FuncType,
@@ -224,7 +225,7 @@ def TypedFunc(*domain_types: Tuple_[Type], cod: Type) -> Type:
                 return False
             domain_hints = set(_hinted_domain(instance.func))
             return_hint = _hinted_codomain(instance.func)
-            from typed.mods.types.base import Any
+            Any = _typed_any()
             if len(_flattypes) == 1 and _flattypes[0] is Any:
                 if return_hint == cod:
                     return True
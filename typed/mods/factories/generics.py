@@ -62,11 +62,22 @@ def Filter(X: Type, *funcs: Tuple_[FunctionType]) -> Type:
         else:
             real_filters.append(f)
 
-    class _Filter(type(X)):
-        def __instancecheck__(cls, instance):
+    real_filters = tuple(real_filters)
+    if len(real_filters) == 1:
+        real_filter = real_filters[0]
+        def instancecheck(cls, instance):
+            return isinstance(instance, X) and bool(real_filter(instance))
+    else:
+        def instancecheck(cls, instance):
             if not isinstance(instance, X):
                 return False
-            return all(f(instance) for f in real_filters)
+            for f in real_filters:
+                if not f(instance):
+                    return False
+            return True
+
+    class _Filter(type(X)):
+        __instancecheck__ = instancecheck
 
     return _Filter(f"Filter({X.__name__})", (X,), {})
 
@@ -117,14 +128,17 @@ def Regex(regex_string: str) -> Type[str]:
     if not isinstance(regex_string, Pattern):
         raise TypeError(f"'{regex_string}' is not a valid pattern.")
 
+    compiled_pattern = re.compile(regex_string)
+    match = compiled_pattern.match
+
     class _Regex(type):
         def __new__(cls, name, bases, dct, regex_pattern):
-            dct['_regex_pattern'] = re.compile(regex_pattern)
+            dct['_regex_pattern'] = compiled_pattern
             dct['_regex_string'] = regex_pattern
             return super().__new__(cls, name, bases, dct)
 
         def __instancecheck__(cls, instance: str) -> bool:
-            return isinstance(instance, str) and cls._regex_pattern.match(instance) is not None
+            return isinstance(instance, str) and match(instance) is not None
 
         def __subclasscheck__(cls, subclass: Type) -> bool:
             return issubclass(subclass, str)
@@ -155,6 +169,18 @@ def Range(x: int, y: int) -> Type[int]:
 
         def __subclasscheck__(cls, subclass: Type) -> bool:
             return issubclass(subclass, int)
+
+        def check_array(cls, values) -> bool:
+            """
+            Checks, in bulk, if all the values are objects of the range type:
+                > the same as 'all(isinstance(v, cls) for v in values)'
+                > without dispatching to '__instancecheck__' per value
+            """
+            lower_bound, upper_bound = cls._lower_bound, cls._upper_bound
+            for value in values:
+                if not isinstance(value, int) or not lower_bound <= value <= upper_bound:
+                    return False
+            return True
     class_name = f"Range({x}, {y})"
     return _Range(class_name, (int,), {}, lower_bound=x, upper_bound=y)
 
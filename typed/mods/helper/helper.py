@@ -1,24 +1,84 @@
 import re
 import inspect
+from collections import namedtuple
+from keyword import iskeyword
 from typing import get_type_hints
+from weakref import WeakKeyDictionary
+
+# caches of '_cached_signature' and '_cached_type_hints':
+#   > weakly keyed, so that they do not keep functions alive
+#   > each entry stores the token of the function it was computed from
+_SIGNATURES = WeakKeyDictionary()
+_TYPE_HINTS = WeakKeyDictionary()
+
+def _cache_token(func):
+    """The attributes of a function its signature and hints depend on."""
+    return (
+        getattr(func, '__annotations__', None),
+        getattr(func, '__wrapped__', None),
+        getattr(func, '__signature__', None),
+        getattr(func, '__defaults__', None),
+        getattr(func, '__kwdefaults__', None),
+        getattr(func, '__code__', None)
+    )
+
+def _cached(cache, compute, func):
+    """
+    Look up 'compute(func)' in a weakly keyed cache.
+        > an entry is valid while the cache token holds the same objects,
+        > so reassigning '__annotations__' or '__wrapped__' invalidates it
+        > (mutating the annotations dict in place does not)
+        > functions that cannot be weakly referenced are never cached
+    """
+    token = _cache_token(func)
+    try:
+        entry = cache.get(func)
+    except TypeError:
+        return compute(func)
+    if entry is not None and all(a is b for a, b in zip(entry[0], token)):
+        return entry[1]
+    result = compute(func)
+    cache[func] = (token, result)
+    return result
+
+def _cached_signature(func):
+    """Cached version of 'inspect.signature'."""
+    return _cached(_SIGNATURES, inspect.signature, func)
+
+def _cached_type_hints(func):
+    """Cached version of '_type_hints'."""
+    return _cached(_TYPE_HINTS, _type_hints, func)
+
+def _type_hints(func):
+    """
+    Type hints of a function, as in 'typing.get_type_hints'.
+        > the annotations are read directly when every hint is a class or 'None':
+        > forward references and typing special forms such as 'Annotated'
+        > are left to 'get_type_hints', which normalises them
+        > as in 'get_type_hints', a 'None' hint means 'type(None)'
+    """
+    annotations = getattr(func, '__annotations__', None)
+    if (
+        not isinstance(func, type)
+        and isinstance(annotations, dict)
+        and all(hint is None or isinstance(hint, type) for hint in annotations.values())
+    ):
+        return {name: type(None) if hint is None else hint for name, hint in annotations.items()}
+    return get_type_hints(func)
 
 def _flat(*types):
     if not types:
         return (), False
     flat_list = []
-    is_flexible = True
-    def _flatten(item):
+    stack = list(reversed(types))
+    while stack:
+        item = stack.pop()
         if isinstance(item, type):
-           flat_list.append(item)
+            flat_list.append(item)
         elif isinstance(item, (list, tuple)):
-            for sub_item in item:
-                _flatten(sub_item)
+            stack.extend(reversed(item))
         else:
             raise TypeError(f"Unsupported type in _flat: {type(item)}")
-    for typ in types:
-       _flatten(typ)
-    if not all(isinstance(t, type) for t in flat_list):
-        raise TypeError("All arguments must be types.")
     return (tuple(flat_list), True)
 
 def _runtime_domain(func):
@@ -28,7 +88,7 @@ def _runtime_domain(func):
     return wrapper
 
 def _runtime_codomain(func):
-    signature = inspect.signature(func)
+    signature = _cached_signature(func)
     return_annotation = signature.return_annotation
     if return_annotation is not inspect.Signature.empty:
         return return_annotation
@@ -36,15 +96,14 @@ def _runtime_codomain(func):
 
 def _is_domain_hinted(func):
     """Check if the function has type hints for all parameters if it has any parameters."""
-    sig = inspect.signature(func)
+    sig = _cached_signature(func)
     parameters = sig.parameters
 
     if not parameters:
         return True
 
-    type_hints = get_type_hints(func)
-    param_hints = {param_name: type_hints.get(param_name) for param_name, param in parameters.items()}
-    non_hinted_params = [param_name for param_name, hint in param_hints.items() if hint is None]
+    type_hints = _cached_type_hints(func)
+    non_hinted_params = [param_name for param_name in parameters if type_hints.get(param_name) is None]
 
     if non_hinted_params:
         raise TypeError(
@@ -55,7 +114,7 @@ def _is_domain_hinted(func):
 
 def _is_codomain_hinted(func):
     """Check if the function has a type hint for its return value and report if missing."""
-    type_hints = get_type_hints(func)
+    type_hints = _cached_type_hints(func)
     if 'return' not in type_hints or type_hints['return'] is None:
         raise TypeError(f"Function '{func.__name__}' must have a return type hint.")
     return True
@@ -70,11 +129,11 @@ def _get_original_func(func):
 
 def _hinted_domain(func):
     original_func = _get_original_func(func)
-    type_hints = get_type_hints(original_func)
+    type_hints = _cached_type_hints(original_func)
     if hasattr(original_func, '_composed_domain_hint'):
         return original_func._composed_domain_hint
     try:
-        sig = inspect.signature(original_func)
+        sig = _cached_signature(original_func)
         domain_types = []
         for param in sig.parameters.values():
             if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
@@ -90,23 +149,35 @@ def _hinted_domain(func):
 
 def _hinted_codomain(func):
     original_func = _get_original_func(func)
-    type_hints = get_type_hints(original_func)
+    type_hints = _cached_type_hints(original_func)
 
     if hasattr(original_func, '_composed_codomain_hint'):
         return original_func._composed_codomain_hint
 
     try:
-        sig = inspect.signature(original_func)
+        sig = _cached_signature(original_func)
         return type_hints.get('return', inspect.Signature.empty)
     except ValueError:
         pass
     return inspect.Signature.empty
 
+# display names of builtin types without '__display__'
+_BUILTIN_DISPLAY_NAMES = {
+    'int': 'Int',
+    'float': 'Float',
+    'str': 'Str',
+    'bool': 'Bool',
+    'NoneType': 'Nill'
+}
+
+_MISSING = object()
+
 def _get_type_display_name(tp):
-    if hasattr(tp, '__display__'):
-        return tp.__display__
-    if hasattr(tp, '__types__'):
-        types = tp.__types__
+    display = getattr(tp, '__display__', _MISSING)
+    if display is not _MISSING:
+        return display
+    types = getattr(tp, '__types__', _MISSING)
+    if types is not _MISSING:
         cname = getattr(tp, '__name__', '')
         if tuple in getattr(tp, '__bases__', ()):
             return f"Prod({', '.join(_get_type_display_name(t) for t in types)})"
@@ -115,57 +186,130 @@ def _get_type_display_name(tp):
         else:
             return ', '.join(_get_type_display_name(t) for t in types)
     name = getattr(tp, '__name__', None)
-    if name in ['int', 'float', 'str', 'bool']:
-        return name.capitalize()
-    if name == 'NoneType':
-        return "Nill"
+    if isinstance(name, str) and name in _BUILTIN_DISPLAY_NAMES:
+        return _BUILTIN_DISPLAY_NAMES[name]
     return name or str(tp)
 
-def _check_domain(func, param_names, expected_domain, actual_domain, args, allow_subclass=True):
+# kinds of type hints, as classified at decoration time:
+#   > simple: a class with the default 'isinstance' semantics
+#   > union:  a type built with 'Union'
+#   > check:  a type providing a 'check' method
+#   > other:  any other type, checked with 'isinstance'
+_SIMPLE, _UNION, _CHECK, _OTHER = b'suco'
+
+_TypedSpec = namedtuple('_TypedSpec', [
+    'signature',
+    'names',
+    'expected',
+    'kinds',
+    'exact',
+    'codomain',
+    'codomain_kind',
+    'codomain_exact',
+    'needs_codomain_check'
+])
+
+def _type_kind(tp):
+    """Classify a type hint, so that checks can dispatch without probing attributes."""
+    if (
+        isinstance(tp, type)
+        and isinstance(getattr(tp, '__types__', None), tuple)
+        and hasattr(tp, '__checked_types__')
+        and tp.__name__.startswith('Union')
+    ):
+        return _UNION
+    if hasattr(tp, 'check'):
+        return _CHECK
+    if type(tp) is type:
+        return _SIMPLE
+    return _OTHER
+
+def _exact_types(tp):
+    """
+    The members of a union hint whose exact type already proves membership:
+        > 'type(x) in _exact_types(U)' implies 'isinstance(x, U)'
+        > precomputed by the 'Union' factory as '__exact_types__'
+    """
+    if _type_kind(tp) != _UNION:
+        return frozenset()
+    return tp.__exact_types__
+
+def _typed_spec(func, expected_domain=(), expected_codomain=inspect.Signature.empty):
+    """
+    Precompute the data used by '_check_domain' and '_check_codomain'.
+        > computed once per typed function, at decoration time,
+        > and stored in the wrapper as '__typed_spec__'
+    """
+    Any = _typed_any()
+    signature = _cached_signature(func)
+    names = tuple(signature.parameters)[:len(expected_domain)]
+    expected = tuple(expected_domain)[:len(names)]
+    return _TypedSpec(
+        signature=signature,
+        names=names,
+        expected=expected,
+        kinds=bytes(_type_kind(t) for t in expected),
+        exact=tuple(_exact_types(t) for t in expected),
+        codomain=expected_codomain,
+        codomain_kind=_type_kind(expected_codomain),
+        codomain_exact=_exact_types(expected_codomain),
+        needs_codomain_check=(
+            expected_codomain is not Any
+            and expected_codomain is not inspect.Signature.empty
+        )
+    )
+
+def _check_domain(func, spec, args):
     mismatches = []
-    for i, (name, expected_type) in enumerate(zip(param_names, expected_domain)):
-        actual_value = args[i]
+    for name, expected_type, kind, exact, actual_value in zip(
+        spec.names, spec.expected, spec.kinds, spec.exact, args
+    ):
         actual_type = type(actual_value)
+        if kind == _SIMPLE:
+            if actual_type is expected_type or isinstance(actual_value, expected_type):
+                continue
+        elif kind == _UNION:
+            if actual_type in exact or isinstance(actual_value, expected_type):
+                continue
+        elif kind == _CHECK:
+            if (
+                (actual_type is expected_type or isinstance(actual_value, expected_type))
+                and expected_type.check(actual_value)
+            ):
+                continue
+        elif isinstance(actual_value, expected_type):
+            continue
 
         expected_display_name = _get_type_display_name(expected_type)
         actual_display_name = _get_type_display_name(actual_type)
-
-        if not isinstance(actual_value, expected_type):
-            mismatches.append(f"\n ==> '{name}' has value '{actual_value}'")
-            mismatches.append(f"\n     [expected_type]: '{expected_display_name}'")
-            mismatches.append(f"\n     [received_type]: '{actual_display_name}'")
-        elif hasattr(expected_type, 'check'):
-            if not expected_type.check(actual_value):
-                mismatches.append(f"\n ==> '{name}' has value '{actual_value}'")
-                mismatches.append(f"\n     [expected_type]: '{expected_display_name}'")
-                mismatches.append(f"\n     [received_type]: '{actual_display_name}'")
+        mismatches.append(
+            f"\n ==> '{name}' has value '{actual_value}'"
+            f"\n     [expected_type]: '{expected_display_name}'"
+            f"\n     [received_type]: '{actual_display_name}'"
+        )
 
     if mismatches:
         mismatch_str = "".join(mismatches) + "."
         raise TypeError(f"Domain mismatch in func '{func.__name__}': {mismatch_str}")
 
-def _check_codomain(func, expected_codomain, actual_codomain, result, allow_subclass=True):
-    expected_display_name = _get_type_display_name(expected_codomain)
-    actual_display_name = _get_type_display_name(actual_codomain)
+def _check_codomain(func, spec, actual_codomain, result):
+    expected_codomain = spec.codomain
+    kind = spec.codomain_kind
 
-    if (
-        isinstance(expected_codomain, type)
-        and hasattr(expected_codomain, '__types__')
-        and isinstance(expected_codomain.__types__, tuple)
-        and expected_codomain.__name__.startswith('Union')
-    ):
+    if kind == _UNION:
+        if actual_codomain in spec.codomain_exact:
+            return
         union_types = expected_codomain.__types__
-        if any(isinstance(result, union_type) for union_type in union_types):
-            for t in union_types:
-                if isinstance(result, t):
-                    if hasattr(t, 'check') and not t.check(result):
-                        raise TypeError(
-                            f"Codomain mismatch in func '{func.__name__}':"
-                            f"\n ==> received the value '{result}'."
-                            f"\n     [expected_type]: '{expected_display_name}'"
-                            f"\n     [received_type]: '{actual_display_name}'"
-                            f"\n     [failed_typed]:  '{_get_type_display_name(t)}'"
-                        )
+        if isinstance(result, expected_codomain):
+            for t in expected_codomain.__checked_types__:
+                if isinstance(result, t) and not t.check(result):
+                    raise TypeError(
+                        f"Codomain mismatch in func '{func.__name__}':"
+                        f"\n ==> received the value '{result}'."
+                        f"\n     [expected_type]: '{_get_type_display_name(expected_codomain)}'"
+                        f"\n     [received_type]: '{_get_type_display_name(actual_codomain)}'"
+                        f"\n     [failed_typed]:  '{_get_type_display_name(t)}'"
+                    )
             return
 
         expected_union_names = [_get_type_display_name(t) for t in union_types]
@@ -173,35 +317,153 @@ def _check_codomain(func, expected_codomain, actual_codomain, result, allow_subc
             f"Codomain mismatch in func '{func.__name__}':"
             f"\n ==> received the value '{result}'."
             f"\n     [expected_type]: 'Union({', '.join(expected_union_names)})'."
-            f"\n     [received_type]: '{actual_display_name}'"
+            f"\n     [received_type]: '{_get_type_display_name(actual_codomain)}'"
         )
 
-    if not isinstance(result, expected_codomain):
+    if kind == _SIMPLE and actual_codomain is expected_codomain:
+        return
+
+    if not (
+        (kind == _CHECK and actual_codomain is expected_codomain)
+        or isinstance(result, expected_codomain)
+    ):
         raise TypeError(
             f"Codomain mismatch in func '{func.__name__}':"
             f"\n ==> received the value '{result}'."
-            f"\n     [expected_type]: '{expected_display_name}'"
-            f"\n     [received_type]: '{actual_display_name}'"
+            f"\n     [expected_type]: '{_get_type_display_name(expected_codomain)}'"
+            f"\n     [received_type]: '{_get_type_display_name(actual_codomain)}'"
         )
-    elif hasattr(expected_codomain, 'check') and not expected_codomain.check(result):
+    elif kind == _CHECK and not expected_codomain.check(result):
         raise TypeError(
             f"Codomain mismatch in func '{func.__name__}':"
             f"\n ==> received the value '{result}'."
-            f"\n    [expected_type]: '{expected_display_name}'"
-            f"\n    [received_type]: '{actual_display_name}'"
+            f"\n    [expected_type]: '{_get_type_display_name(expected_codomain)}'"
+            f"\n    [received_type]: '{_get_type_display_name(actual_codomain)}'"
             f"\n    [failed_typed]:  '{_get_type_display_name(expected_codomain)}'"
         )
 
+def _typed_call(func, spec):
+    """
+    Generate a call wrapper specialized to the signature of a typed function:
+        > the arguments are bound by the generated signature itself
+        > and each of them is checked inline, without loops
+        > mismatches are reported by '_check_domain' and '_check_codomain'
+        > the builtins it uses are bound to reserved '__typed_' names,
+        > so that parameters named 'type' or 'isinstance' cannot shadow them
+    Returns None if the signature has no fixed arity.
+    """
+    parameters = tuple(spec.signature.parameters.values())
+    if spec.names != tuple(param.name for param in parameters):
+        return None
+
+    namespace = {
+        '__typed_func': func,
+        '__typed_spec': spec,
+        '__typed_check_domain': _check_domain,
+        '__typed_check_codomain': _check_codomain,
+        '__typed_type_of': type,
+        '__typed_isinstance': isinstance
+    }
+    params = []
+    call_args = []
+    conditions = []
+    previous_kind = None
+    for i, (param, expected_type, kind) in enumerate(zip(parameters, spec.expected, spec.kinds)):
+        name = param.name
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) or name.startswith('__typed_'):
+            return None
+        if previous_kind is param.POSITIONAL_ONLY and param.kind is not param.POSITIONAL_ONLY:
+            params.append('/')
+        if param.kind is param.KEYWORD_ONLY and previous_kind is not param.KEYWORD_ONLY:
+            params.append('*')
+        previous_kind = param.kind
+
+        if param.default is param.empty:
+            params.append(name)
+        else:
+            namespace[f'__typed_default{i}'] = param.default
+            params.append(f'{name}=__typed_default{i}')
+        call_args.append(f'{name}={name}' if param.kind is param.KEYWORD_ONLY else name)
+
+        t = f'__typed_type{i}'
+        namespace[t] = expected_type
+        if kind == _SIMPLE:
+            conditions.append(f'(__typed_type_of({name}) is {t} or __typed_isinstance({name}, {t}))')
+        elif kind == _UNION:
+            namespace[f'__typed_exact{i}'] = spec.exact[i]
+            conditions.append(f'(__typed_type_of({name}) in __typed_exact{i} or __typed_isinstance({name}, {t}))')
+        elif kind == _CHECK:
+            conditions.append(f'((__typed_type_of({name}) is {t} or __typed_isinstance({name}, {t})) and {t}.check({name}))')
+        else:
+            conditions.append(f'__typed_isinstance({name}, {t})')
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        params.append('/')
+
+    func_name = func.__name__
+    if not func_name.isidentifier() or iskeyword(func_name) or func_name.startswith('__typed_'):
+        func_name = 'typed_call'
+    lines = [f"def {func_name}({', '.join(params)}):"]
+    if conditions:
+        lines.append(f"    if not ({' and '.join(conditions)}):")
+        lines.append(f"        __typed_check_domain(__typed_func, __typed_spec, ({''.join(n + ', ' for n in spec.names)}))")
+    lines.append(f"    __typed_result = __typed_func({', '.join(call_args)})")
+
+    if spec.needs_codomain_check:
+        namespace['__typed_codomain'] = spec.codomain
+        check_codomain = "__typed_check_codomain(__typed_func, __typed_spec, __typed_type_of(__typed_result), __typed_result)"
+        kind = spec.codomain_kind
+        if kind == _SIMPLE:
+            lines.append("    if not (__typed_type_of(__typed_result) is __typed_codomain or __typed_isinstance(__typed_result, __typed_codomain)):")
+            lines.append(f"        {check_codomain}")
+        elif kind == _UNION:
+            namespace['__typed_codomain_exact'] = spec.codomain_exact
+            lines.append("    if __typed_type_of(__typed_result) not in __typed_codomain_exact:")
+            lines.append(f"        {check_codomain}")
+        elif kind == _CHECK:
+            lines.append(f"    {check_codomain}")
+        else:
+            lines.append("    if not __typed_isinstance(__typed_result, __typed_codomain):")
+            lines.append(f"        {check_codomain}")
+    lines.append("    return __typed_result")
+
+    code = compile("\n".join(lines), f"<typed {func_name}>", "exec")
+    exec(code, namespace)
+    return namespace[func_name]
+
 def _nill() -> type(None):
         pass
 
+_TYPED_ANY = None
+
+def _typed_any():
+    """
+    The 'Any' type.
+        > imported lazily, once, to avoid circular imports
+        > cheaper than a function-level import in hot checks
+    """
+    global _TYPED_ANY
+    if _TYPED_ANY is None:
+        from typed.mods.types.base import Any
+        _TYPED_ANY = Any
+    return _TYPED_ANY
+
+_BUILTIN_NULLS = None
+
 def _builtin_nulls():
+    """
+    The null objects of the builtin types.
+        > built lazily, on the first call, to avoid circular imports
+    """
+    global _BUILTIN_NULLS
+    if _BUILTIN_NULLS is not None:
+        return _BUILTIN_NULLS
+
     from typed.mods.factories.base import List, Tuple, Set, Dict
     from typed.mods.types.func import TypedFuncType
     from typed.mods.types.base import Pattern, Any
     from typed.models import Model, MODEL, Exact, EXACT
 
-    return {
+    _BUILTIN_NULLS = {
         Dict: {},
         dict: {},
         Tuple: (),
@@ -222,6 +484,7 @@ def _builtin_nulls():
         MODEL: Model(),
         EXACT: Exact()
     }
+    return _BUILTIN_NULLS
 
 def _get_null_object(typ):
     from typed.models import MODEL, EXACT, Instance
@@ -238,49 +501,59 @@ def _get_null_object(typ):
                 result[key] = _get_null_object(wrapper.type)
         return typ(result)
 
-    if typ in _builtin_nulls():
-        return _builtin_nulls()[typ]
-    if hasattr(typ, '__bases__'):
-        bases = typ.__bases__
-        if list in bases:
-            if hasattr(typ, '__types__') and typ.__types__:
-                elem_null = _get_null_object(typ.__types__[0])
-                return [elem_null]
-            else:
-                return []
-        if tuple in bases:
-            if hasattr(typ, '__types__') and typ.__types__:
-                if hasattr(typ, '__name__') and typ.__name__.startswith("Prod"):
-                    return tuple(_get_null_object(t) for t in typ.__types__)
-                return tuple()
-            else:
-                return ()
-        if set in bases:
-            if hasattr(typ, '__types__') and typ.__types__:
-                elem_null = _get_null_object(typ.__types__[0])
-                return {elem_null}
-            else:
-                return set()
-        if dict in bases:
-            if hasattr(typ, '__types__') and typ.__types__:
-                vtyp = typ.__types__[0]
-                vnull = _get_null_object(vtyp)
-                if vtyp in (str,):
-                    return {"": vnull}
-                elif vtyp in (int,):
-                    return {0: vnull}
-                elif vtyp in (float,):
-                    return {0.0: vnull}
-                else:
-                    return {None: vnull}
-            else:
-                return {}
+    nulls = _builtin_nulls()
+    if typ in nulls:
+        null = nulls[typ]
+        if isinstance(null, (dict, list, set)):
+            return type(null)()
+        return null
+    if isinstance(typ, type) and '_null_factory' in typ.__dict__:
+        return typ._null_factory(typ.__types__)
+    for base in getattr(typ, '__bases__', ()):
+        if base in (list, tuple, set, dict):
+            return base()
     return None
 
+def _list_null(types):
+    """Null object of the 'List' types: set in them as '_null_factory'."""
+    if types:
+        return [_get_null_object(types[0])]
+    return []
+
+def _tuple_null(types):
+    """Null object of the 'Tuple' and 'UProd' types: set in them as '_null_factory'."""
+    return ()
+
+def _prod_null(types):
+    """Null object of the 'Prod' types: set in them as '_null_factory'."""
+    return tuple(_get_null_object(t) for t in types)
+
+def _set_null(types):
+    """Null object of the 'Set' types: set in them as '_null_factory'."""
+    if types:
+        return {_get_null_object(types[0])}
+    return set()
+
+def _dict_null(types):
+    """Null object of the 'Dict' types: set in them as '_null_factory'."""
+    if not types:
+        return {}
+    vtyp = types[0]
+    vnull = _get_null_object(vtyp)
+    if vtyp in (str,):
+        return {"": vnull}
+    elif vtyp in (int,):
+        return {0: vnull}
+    elif vtyp in (float,):
+        return {0.0: vnull}
+    else:
+        return {None: vnull}
+
 def _is_null_of_type(x, typ):
+    nulls = _builtin_nulls()
+    if typ in nulls:
+        return x == nulls[typ]
     null = _get_null_object(typ)
-    if typ in _builtin_nulls().keys():
-        return x == _builtin_nulls()[typ]
     if hasattr(typ, '__bases__'):
         base = typ.__bases__[0]
         return x == null and isinstance(x, base)
@@ -303,7 +576,7 @@ def _get_num_args(func):
     1. Returns the number of fixed arguments of a function.
     2. Returns -1 if the function contains *args or **kwargs.
     """
-    signature = inspect.signature(func)
+    signature = _cached_signature(func)
     num_args = 0
     for param in signature.parameters.values():
         if param.kind == param.VAR_POSITIONAL or param.kind == param.VAR_KEYWORD:
@@ -317,7 +590,7 @@ def _get_num_kwargs(func):
     1. Returns the number of keyword arguments of a function.
     2. Returns -1 if the function contains *args or **kwargs.
     """
-    sig = inspect.signature(func)
+    sig = _cached_signature(func)
     count = 0
     for param in sig.parameters.values():
         if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
@@ -331,7 +604,7 @@ def _get_num_pos_args(func):
     Returns the number of required positional arguments (no default).
     Returns -1 if the function contains *args or **kwargs.
     """
-    signature = inspect.signature(func)
+    signature = _cached_signature(func)
     num_args = 0
     for param in signature.parameters.values():
         if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
@@ -1,27 +1,34 @@
+from functools import lru_cache as cache
+
+class _ATTR(type):
+    def __instancecheck__(cls, instance):
+        attribute = cls._required_attribute
+        if attribute is not None:
+            return hasattr(instance, attribute)
+        for attr in cls._required_attributes:
+            if not hasattr(instance, attr):
+                return False
+        return True
+
+class _ATTR_(metaclass=_ATTR):
+    _required_attribute = None
+    _required_attributes = ()
+
 def ATTR(attributes):
     if isinstance(attributes, str):
         attributes = (attributes,)
     elif not isinstance(attributes, list):
         raise TypeError("attributes must be a string or a list of strings")
+    return _ATTR_type(tuple(attributes))
 
+@cache(maxsize=None)
+def _ATTR_type(attributes):
+    """Build the type of 'ATTR': cached, so equal attributes give the same type."""
     type_name = f'ATTR{"_and_".join(attr.strip("_").capitalize() for attr in attributes)}'
-
-    class _ATTR(type):
-        def __init__(cls, name, bases, dct, attributes=None):
-            super().__init__(name, bases, dct)
-            if attributes:
-                setattr(cls, '_required_attributes', attributes)
-
-        def __instancecheck__(cls, instance):
-            required_attributes = getattr(cls, '_required_attributes', None)
-            if required_attributes:
-                return all(hasattr(instance, attr) for attr in required_attributes)
-            return True
-
-    class ATTR_(metaclass=_ATTR):
-        pass
-
-    return type(type_name, (ATTR_,), {'_required_attributes': tuple(attributes)})
+    return _ATTR(type_name, (_ATTR_,), {
+        '_required_attribute': attributes[0] if len(attributes) == 1 else None,
+        '_required_attributes': attributes
+    })
 
 CALLABLE       = ATTR('__call__')
 ITERABLE       = ATTR('__iter__')
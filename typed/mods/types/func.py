@@ -9,7 +9,9 @@ from typed.mods.helper.helper import (
     _runtime_domain,
     _runtime_codomain,
     _check_domain,
-    _check_codomain
+    _check_codomain,
+    _typed_spec,
+    _typed_call
 )
 from typed.mods.types.meta import (
     _Callable,
@@ -205,18 +207,18 @@ class HintedFuncType(HintedDomFuncType, HintedCodFuncType):
 class TypedDomFuncType(HintedDomFuncType):
     def __init__(self, func):
         super().__init__(func)
+        self.__typed_spec__ = _typed_spec(self.func, self._hinted_domain)
 
     def __call__(self, *args, **kwargs):
-        sig = inspect.signature(self.func)
-        if sig.parameters:
-            bound_args = sig.bind(*args, **kwargs)
+        spec = self.__typed_spec__
+        if spec.signature.parameters:
+            bound_args = spec.signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
-            _check_domain(self.func, sig, bound_args)
+            _check_domain(self.func, spec, tuple(bound_args.arguments.values()))
             result = self.func(*bound_args.args, **bound_args.kwargs)
         else:
             if args or kwargs:
-                sig = inspect.signature(self.func)
-                bound_args = sig.bind(*args, **kwargs)
+                bound_args = spec.signature.bind(*args, **kwargs)
                 bound_args.apply_defaults()
                 result = self.func(*bound_args.args, **bound_args.kwargs)
             else:
@@ -234,11 +236,12 @@ class TypedDomFuncType(HintedDomFuncType):
 class TypedCodFuncType(HintedCodFuncType):
     def __init__(self, func):
         super().__init__(func)
+        self.__typed_spec__ = _typed_spec(self.func, expected_codomain=self._hinted_codomain)
 
     def __call__(self, *args, **kwargs):
+        spec = self.__typed_spec__
         try:
-            sig = inspect.signature(self.func)
-            bound_args = sig.bind(*args, **kwargs)
+            bound_args = spec.signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
 
             result = self.func(*bound_args.args, **bound_args.kwargs)
@@ -246,8 +249,8 @@ class TypedCodFuncType(HintedCodFuncType):
         except Exception as e:
             raise e
 
-        actual_codomain = type(result)
-        _check_codomain(self.func, self._codomain_hint_for_check, actual_codomain, result)
+        if spec.needs_codomain_check:
+            _check_codomain(self.func, spec, type(result), result)
 
         return result
 
@@ -278,28 +281,26 @@ class TypedFuncType(HintedFuncType, TypedDomFuncType, TypedCodFuncType):
         if not hasattr(self, '_hinted_codomain'):
             self._hinted_codomain = _hinted_codomain(self.func)
         self._codomain_hint_for_check = self._hinted_codomain
+        self.__typed_spec__ = _typed_spec(
+            self.func,
+            self._domain_hints_for_check,
+            self._codomain_hint_for_check
+        )
+        self.__typed_call__ = _typed_call(self.func, self.__typed_spec__)
 
     def __call__(self, *args, **kwargs):
-        sig = inspect.signature(self.func)
-        bound_args = sig.bind(*args, **kwargs)
+        if self.__typed_call__ is not None:
+            return self.__typed_call__(*args, **kwargs)
+        spec = self.__typed_spec__
+        bound_args = spec.signature.bind(*args, **kwargs)
         bound_args.apply_defaults()
-        actual_domain_values = list(bound_args.arguments.values())
-        param_names_in_call_order = list(bound_args.arguments.keys())
-        if sig.parameters:
-            _check_domain(
-                self.func,
-                param_names_in_call_order,
-                self._domain_hints_for_check,
-                None,
-                actual_domain_values
-            )
+        if spec.names:
+            _check_domain(self.func, spec, tuple(bound_args.arguments.values()))
 
         result = self.func(*bound_args.args, **bound_args.kwargs)
-        if not hasattr(self, '_codomain_hint_for_check'):
-            raise AttributeError(f"'{self.__name__}': missing __codomain__ type hints.")
 
-        actual_codomain = type(result)
-        _check_codomain(self.func, self._codomain_hint_for_check, actual_codomain, result)
+        if spec.needs_codomain_check:
+            _check_codomain(self.func, spec, type(result), result)
 
         return result
 